@@ -3,9 +3,21 @@ from typing import Annotated
 
 import typer
 
+from utils.answer_store import AnswerStore
 from utils.aoc_client import AOCClient
-from utils.display_manager import create_report, print, print_error, print_warning
+from utils.batch import resolve_inputs, run_batch
+from utils.display_manager import (
+    create_batch_report,
+    create_report,
+    create_verification_report,
+    print,
+    print_error,
+    print_success,
+    print_warning,
+)
 from utils.solution import get_latest_year, solution_factory
+from utils.verification import VerificationStatus
+from utils.verification import verify as verify_solutions
 
 app = typer.Typer(help="Advent of Code - Puzzle Solving Tool", add_completion=False)
 
@@ -33,17 +45,42 @@ def solve(
     ] = False,
     sample: Annotated[
         bool,
-        typer.Option("--sample", help="Use the sample input file (dayXX_sample.txt)"),
+        typer.Option(
+            "--sample",
+            help="Use the sample input file (dayXX_sample.txt or dayXX_sample_pN.txt)",
+        ),
+    ] = False,
+    progress: Annotated[
+        bool,
+        typer.Option("--progress", help="Display live progress of long-running parts"),
     ] = False,
+    inputs: Annotated[
+        str,
+        typer.Option(
+            "--inputs",
+            "-i",
+            help="Solve against every input file of a directory or glob pattern",
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers", "-w", min=1, help="Number of worker processes with --inputs"
+        ),
+    ] = 1,
 ):
     # submit and sample are mutually exclusive
     if submit and sample:
         print_error("Cannot use both --submit and --sample options together.")
         raise typer.Exit(code=1)  # Use typer.Exit for errors
 
+    if inputs is not None:
+        solve_batch(day, year, part, inputs, workers, progress, submit or sample)
+        return
+
     # run solution
     try:
-        solution = solution_factory(day, year, part, sample, submit)
+        solution = solution_factory(day, year, part, sample, submit, progress)
         solution_report = solution.run()
     except ImportError:
         print_error(
@@ -55,6 +92,101 @@ def solve(
     create_report(solution_report)
 
 
+def solve_batch(
+    day: int,
+    year: int,
+    part: int,
+    inputs: str,
+    workers: int,
+    progress: bool,
+    single_input: bool,
+) -> None:
+    # --submit and --sample only make sense for the default input files
+    if single_input:
+        print_error("Cannot use --inputs with --submit or --sample options.")
+        raise typer.Exit(code=1)
+
+    # live progress can only be displayed for parts solved in this process
+    if progress and workers > 1:
+        print_error("Cannot use --progress with --inputs and more than one worker.")
+        raise typer.Exit(code=1)
+
+    input_files = resolve_inputs(inputs)
+    if not input_files:
+        print_error(f"No input file found for {inputs}.")
+        raise typer.Exit(code=1)
+
+    try:
+        batch_results, total_time = run_batch(
+            day, year, part, input_files, workers, progress
+        )
+    except ImportError:
+        print_error(
+            f"Solution for {year}/{day} is not implemeted. Please run 'create' command first."
+        )
+        raise typer.Exit(code=1)
+
+    create_batch_report(day, year, batch_results, total_time)
+
+
+@app.command()
+def verify(
+    year: Annotated[
+        int,
+        typer.Option("--year", "-y", help="Only verify this year (default: all years)"),
+    ] = None,
+    sample: Annotated[
+        bool,
+        typer.Option("--sample", help="Verify against the sample input files"),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="Number of worker processes"),
+    ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Run every day, even unchanged ones"),
+    ] = False,
+) -> None:
+    """Run every implemented day in parallel and check the recorded answers."""
+
+    verification_results = verify_solutions(year, sample, workers, not no_cache)
+    if not verification_results:
+        print_warning("No solution found to verify.")
+        return
+
+    create_verification_report(verification_results)
+
+    # fail if any answer is wrong, so that it can be used as a guard
+    if any(
+        verification_result.status
+        in (VerificationStatus.FAILED, VerificationStatus.ERROR)
+        for verification_result in verification_results
+    ):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def record(
+    day: DayArg,
+    part: Annotated[
+        int, typer.Argument(min=1, max=2, help="Part of the puzzle (1 or 2)")
+    ],
+    answer: Annotated[str, typer.Argument(help="Known-correct answer")],
+    year: Annotated[
+        int, typer.Option("--year", "-y", help="Year of the puzzle")
+    ] = get_latest_year(),
+    sample: Annotated[
+        bool,
+        typer.Option("--sample", help="Record the answer of the sample input"),
+    ] = False,
+) -> None:
+    """Record a known-correct answer, used by the 'verify' command."""
+
+    AnswerStore().record(year, day, part, answer, sample)
+    print_success(f"Recorded answer {answer} for {year} day {day} part {part}.")
+
+
 @app.command()
 def create(
     day: DayArg,
@@ -179,6 +311,8 @@ def delete(
         Path(f"solutions/{year}/day{day:02d}.py"),
         Path(f"inputs/{year}/day{day:02d}.txt"),
         Path(f"inputs/{year}/day{day:02d}_sample.txt"),
+        Path(f"inputs/{year}/day{day:02d}_sample_p1.txt"),
+        Path(f"inputs/{year}/day{day:02d}_sample_p2.txt"),
         Path(f"problems/{year}/day{day:02d}.md"),
     ]
 
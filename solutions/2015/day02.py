@@ -1,30 +1,25 @@
 from typing import Any
 
-from utils.solution import Solution
+from utils.solution import InputParser, Solution
 
 
 class DaySolution(Solution):
+    INPUT_PARSER = InputParser.MAP_REDUCE
+
     def parse_line(self, line):
         # note: sorted is only used for part 2
         return sorted([int(x) for x in line.split("x")])
 
-    def solve_part1(self, data: Any) -> int:
-        area = sum(
-            [
-                2 * (length * width + width * height + height * length)
-                + min(length * width, width * height, height * length)
-                for length, width, height in data
-            ]
+    def map_part1(self, line: Any) -> int:
+        length, width, height = line
+        area = 2 * (length * width + width * height + height * length) + min(
+            length * width, width * height, height * length
         )
 
         return area
 
-    def solve_part2(self, data: Any) -> int:
-        ribbon_length = sum(
-            [
-                2 * (length + width) + length * width * height
-                for length, width, height in data
-            ]
-        )
+    def map_part2(self, line: Any) -> int:
+        length, width, height = line
+        ribbon_length = 2 * (length + width) + length * width * height
 
         return ribbon_length
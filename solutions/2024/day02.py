@@ -1,11 +1,13 @@
 from typing import Any
 
-from utils.solution import Solution
+from utils.solution import InputParser, Solution
 
 
 class DaySolution(Solution):
-    def parse_data(self, data: str | list[str]) -> str | list[str]:
-        return [[int(x) for x in line.split()] for line in data]
+    INPUT_PARSER = InputParser.MAP_REDUCE
+
+    def parse_line(self, line: str) -> list[int]:
+        return [int(x) for x in line.split()]
 
     def is_safe(self, report) -> bool:
         deltas = [a - b for a, b in zip(report, report[1:])]
@@ -16,26 +18,18 @@ class DaySolution(Solution):
 
         return is_monotonic and is_stable
 
-    def solve_part1(self, data: Any) -> int:
-        safe_count = 0
-        for report in data:
-            if self.is_safe(report):
-                safe_count += 1
-        return safe_count
-
-    def solve_part2(self, data: Any) -> int:
-        safe_count = 0
-        for report in data:
-            # Check if report is already safe without removing any level
-            if self.is_safe(report):
-                safe_count += 1
-                continue
-
-            # Try removing each level and check if resulting report is safe
-            for i in range(len(report)):
-                modified_report = report[:i] + report[i + 1 :]
-                if self.is_safe(modified_report):
-                    safe_count += 1
-                    break
-
-        return safe_count
+    def map_part1(self, report: Any) -> int:
+        return int(self.is_safe(report))
+
+    def map_part2(self, report: Any) -> int:
+        # Check if report is already safe without removing any level
+        if self.is_safe(report):
+            return 1
+
+        # Try removing each level and check if resulting report is safe
+        for i in range(len(report)):
+            modified_report = report[:i] + report[i + 1 :]
+            if self.is_safe(modified_report):
+                return 1
+
+        return 0
@@ -1,5 +1,5 @@
-# note: sample input was not the same between part 1 and part 2 on the AOC puzzle description,
-# however sample from part 2 resulted in the same input in part 1, so we kept this one.
+# note: sample input is not the same between part 1 and part 2 on the AOC puzzle description,
+# so part 2 uses its own sample file (day03_sample_p2.txt).
 
 import re
 from typing import Any
@@ -10,9 +10,6 @@ from utils.solution import InputParser, Solution
 class DaySolution(Solution):
     INPUT_PARSER = InputParser.ONE_LINE
 
-    def parse_data(self) -> str:
-        return self.input_data
-
     def solve_part1(self, data: Any) -> int:
         matches = re.findall(r"mul\((\d{1,3}),(\d{1,3})\)", data)
 
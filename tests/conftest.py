@@ -0,0 +1,45 @@
+import importlib
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+YEAR = 2099  # year of the solutions written by the aoc_tree fixture
+
+
+class AocTree:
+    """Temporary project tree with its own solutions/ and inputs/ directories."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def write_solution(self, day: int, source: str, year: int = YEAR) -> Path:
+        solution_file = self.root / f"solutions/{year}/day{day:02d}.py"
+        solution_file.parent.mkdir(parents=True, exist_ok=True)
+        solution_file.write_text(textwrap.dedent(source))
+        importlib.invalidate_caches()
+        return solution_file
+
+    def write_input(
+        self, day: int, content: str, suffix: str = "", year: int = YEAR
+    ) -> Path:
+        input_file = self.root / f"inputs/{year}/day{day:02d}{suffix}.txt"
+        input_file.parent.mkdir(parents=True, exist_ok=True)
+        input_file.write_text(content)
+        return input_file
+
+
+def _forget_test_solutions() -> None:
+    for module_name in list(sys.modules):
+        if module_name.startswith(f"solutions.{YEAR}"):
+            del sys.modules[module_name]
+
+
+@pytest.fixture
+def aoc_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AocTree:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _forget_test_solutions()
+    yield AocTree(tmp_path)
+    _forget_test_solutions()
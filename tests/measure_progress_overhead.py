@@ -0,0 +1,65 @@
+"""Measure the overhead of --progress on a ticking loop.
+
+Run from the repository root with `python -m tests.measure_progress_overhead`.
+The loop is timed alternately with and without the monitor, in pairs.
+"""
+
+import io
+import statistics
+
+from rich.console import Console
+
+from utils.benchmark import Benchmark
+from utils.progress import ProgressMonitor
+from utils.solution import Solution
+
+
+class TickingSolution(Solution):
+    def __init__(self):
+        # no input file needed, only the instrumentation state
+        self._ticks = 0
+        self._progress_total = None
+
+
+def ticking_loop(solution: Solution, ticks: int) -> None:
+    solution.set_progress_total(ticks)
+    for _ in range(ticks):
+        solution.tick()
+
+
+def monitored_loop(solution: Solution, ticks: int, console: Console) -> None:
+    with ProgressMonitor(solution, 1, console=console):
+        ticking_loop(solution, ticks)
+
+
+def measure_overheads(ticks: int = 10_000_000, pairs: int = 7) -> list[float]:
+    """Relative overhead of the progress monitor in each pair of runs.
+
+    Each loop lasts about a second, as a part only displays its progress after the
+    monitor delay, and is then refreshed every interval. Pairing runs cancels the
+    slow drift of the machine, which can be larger than the overhead itself.
+    """
+    solution = TickingSolution()
+    # render into a buffer, with the cost of a real terminal but no output
+    console = Console(file=io.StringIO(), force_terminal=True, width=100)
+    benchmark = Benchmark(max_time=0, min_rounds=1)
+
+    overheads = []
+    for _ in range(pairs):
+        plain = benchmark(ticking_loop, solution, ticks)
+        monitored = benchmark(monitored_loop, solution, ticks, console)
+        overheads.append(monitored.median / plain.median - 1)
+
+    return overheads
+
+
+def main() -> None:
+    overheads = measure_overheads()
+    print(
+        f"Progress monitor overhead: {statistics.median(overheads):+.2%} "
+        f"(pairs from {min(overheads):+.2%} to {max(overheads):+.2%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from conftest import YEAR
+from utils.batch import resolve_inputs, run_batch
+from utils.display_manager import create_batch_report
+
+FAILING_SOLUTION = """
+    from utils.solution import Solution
+
+
+    class DaySolution(Solution):
+        def solve_part1(self, data):
+            if "boom" in data:
+                raise ValueError("boom")
+            return len(data)
+"""
+
+
+def write_inputs(root: Path) -> list[Path]:
+    inputs = []
+    for name, content in [("a", "1\n2"), ("b", "boom"), ("c", "1\n2\n3")]:
+        input_file = root / f"other_inputs/{name}/day01.txt"
+        input_file.parent.mkdir(parents=True)
+        input_file.write_text(content)
+        inputs.append(input_file)
+    return inputs
+
+
+def test_resolve_inputs_from_directory(tmp_path):
+    for name in ["b.txt", "a.txt", "notes.md"]:
+        (tmp_path / name).write_text("")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested/c.txt").write_text("")
+
+    assert resolve_inputs(str(tmp_path)) == [tmp_path / "a.txt", tmp_path / "b.txt"]
+
+
+def test_resolve_inputs_from_glob(aoc_tree):
+    write_inputs(aoc_tree.root)
+    Path("other_inputs/a/deeper").mkdir()
+    Path("other_inputs/a/deeper/day01.txt").write_text("")
+
+    assert resolve_inputs("other_inputs/*/day01.txt") == [
+        Path("other_inputs/a/day01.txt"),
+        Path("other_inputs/b/day01.txt"),
+        Path("other_inputs/c/day01.txt"),
+    ]
+    assert resolve_inputs("other_inputs/**/day01.txt") == [
+        Path("other_inputs/a/day01.txt"),
+        Path("other_inputs/a/deeper/day01.txt"),
+        Path("other_inputs/b/day01.txt"),
+        Path("other_inputs/c/day01.txt"),
+    ]
+    assert resolve_inputs("other_inputs/*/missing.txt") == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_reports_failing_inputs_as_errors(aoc_tree, workers):
+    aoc_tree.write_solution(1, FAILING_SOLUTION)
+    input_files = write_inputs(aoc_tree.root)
+
+    batch_results, total_time = run_batch(1, YEAR, 1, input_files, workers=workers)
+
+    assert [batch_result.input_file for batch_result in batch_results] == input_files
+    assert [
+        batch_result.report.part1.result if batch_result.report else None
+        for batch_result in batch_results
+    ] == [2, None, 3]
+    assert [batch_result.error for batch_result in batch_results] == [
+        None,
+        "boom",
+        None,
+    ]
+    assert total_time > 0
+
+
+def test_batch_report_counts_errors(aoc_tree, capsys):
+    aoc_tree.write_solution(1, FAILING_SOLUTION)
+    batch_results, _ = run_batch(1, YEAR, 1, write_inputs(aoc_tree.root))
+
+    create_batch_report(1, YEAR, batch_results, 0.5)
+
+    assert (
+        "2 inputs solved, 1 errors, in 0.500 s (6.0 inputs/s)"
+        in capsys.readouterr().out
+    )
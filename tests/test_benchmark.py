@@ -0,0 +1,122 @@
+import random
+from array import array
+
+from utils.benchmark import BaselineStore, Benchmark, compare, reject_outliers
+
+
+def make_medians(center: float, count: int = 5, seed: int = 0) -> list[float]:
+    rng = random.Random(seed)
+    return [center * rng.uniform(0.9, 1.1) for _ in range(count)]
+
+
+def test_median_within_the_sessions_is_not_slower():
+    medians = make_medians(1.0)
+    comparison = compare(medians, 1.05)
+
+    assert comparison.p_value > 0.1
+    assert comparison.sessions == 5
+    assert not comparison.slower
+
+
+def test_identical_sessions_are_not_slower():
+    # no spread at all, but the same median is no evidence of a slowdown
+    comparison = compare([1.0] * 5, 1.0)
+
+    assert comparison.ratio == 1.0
+    assert not comparison.slower
+
+
+def test_median_beyond_the_sessions_is_flagged():
+    comparison = compare(make_medians(1.0), 3.0)
+
+    assert comparison.p_value < 0.001
+    assert comparison.ratio > 2.5
+    assert comparison.slower
+
+
+def test_faster_median_is_not_flagged():
+    comparison = compare(make_medians(1.5), 1.0)
+
+    assert comparison.p_value > 0.999
+    assert not comparison.slower
+
+
+def test_small_significant_slowdown_is_below_threshold():
+    # significant for such tight sessions, but only 50% above the slowest one
+    medians = [1.0, 1.001, 1.002, 1.003]
+    comparison = compare(medians, 1.5)
+
+    assert comparison.p_value < 0.01
+    assert not comparison.slower
+    assert compare(medians, 1.5, threshold=0.25).slower
+
+
+def test_few_sessions_are_never_flagged():
+    assert not compare([1.0], 10.0).slower
+    assert not compare([1.0, 1.01], 10.0).slower
+    assert compare([1.0, 1.01, 1.02], 10.0).slower
+
+
+def test_same_function_in_separate_sessions_is_not_flagged():
+    # each Benchmark call stands for a session, whose median is saved
+    medians = [
+        Benchmark(max_time=0.05, min_round_time=0.001)(sum, range(1000)).median
+        for _ in range(4)
+    ]
+
+    assert not compare(medians[:3], medians[3]).slower
+
+
+def test_baseline_store_keeps_the_last_sessions(tmp_path):
+    baseline_file = tmp_path / "benchmark_sessions.json"
+    baseline_store = BaselineStore(baseline_file)
+    for session in range(BaselineStore.MAX_SESSIONS + 2):
+        baseline_store.add("day01", float(session))
+    baseline_store.save()
+
+    medians = BaselineStore(baseline_file).get("day01")
+    assert medians == [float(session) for session in range(2, 12)]
+    assert BaselineStore(baseline_file).get("day02") == []
+
+
+def test_baseline_store_ignores_a_corrupt_file(tmp_path):
+    baseline_file = tmp_path / "benchmark_sessions.json"
+    baseline_file.write_text("{not json")
+
+    assert BaselineStore(baseline_file).get("day01") == []
+
+
+def test_reject_outliers_uses_tukey_fences():
+    samples = array("d", [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 10.0])
+
+    assert list(reject_outliers(samples)) == [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6]
+
+
+def test_reject_outliers_keeps_small_samples():
+    samples = array("d", [1.0, 2.0, 100.0])
+
+    assert reject_outliers(samples) is samples
+
+
+def test_calibrate_reaches_min_round_time():
+    benchmark = Benchmark(min_round_time=0.002)
+    iterations, round_time = benchmark._calibrate(lambda: sum(range(100)))
+
+    assert iterations > 1
+    assert round_time >= 0.002
+
+
+def test_benchmark_runs_min_rounds():
+    stats = Benchmark(max_time=0.01, min_rounds=5, min_round_time=0.001)(
+        sum, range(100)
+    )
+
+    assert stats.rounds + stats.outliers >= 5
+    assert stats.min > 0
+
+
+def test_benchmark_fixture(benchmark):
+    stats = benchmark(sum, range(100))
+
+    assert stats.rounds > 0
+    assert stats.median > 0
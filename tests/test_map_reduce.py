@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from utils.map_reduce import map_reduce, split_chunks
+from utils.solution import InputParser, Solution
+
+
+class ConcatSolution(Solution):
+    """Concatenate lines: a non-commutative reduce, to check that order is kept."""
+
+    INPUT_PARSER = InputParser.MAP_REDUCE
+    MAP_REDUCE_CHUNK_SIZE = 4
+    MAP_REDUCE_WORKERS = 2
+    MAP_REDUCE_INITIAL = ""
+
+    def map_part1(self, line: str) -> str:
+        return line
+
+    def map_part2(self, line: str) -> int:
+        return int(line)
+
+
+class PidSolution(Solution):
+    """Collect the ids of the processes that mapped the lines."""
+
+    INPUT_PARSER = InputParser.MAP_REDUCE
+    MAP_REDUCE_CHUNK_SIZE = 4
+    MAP_REDUCE_INITIAL = frozenset()
+
+    def map_part1(self, line: str) -> frozenset[int]:
+        return frozenset([os.getpid()])
+
+    def reduce_part1(self, left: frozenset[int], right: frozenset[int]):
+        return left | right
+
+
+def solve_pids(input_file: Path) -> tuple[int, frozenset[int]]:
+    # note: executed in a worker process, so it must stay a module-level function
+    solution = PidSolution(1, 2000, 1, input_file=input_file)
+    return os.getpid(), solution.run().part1.result
+
+
+def write_input(tmp_path: Path, content: bytes) -> Path:
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(content)
+    return input_file
+
+
+def read_chunks(input_file: Path, chunk_size: int) -> list[bytes]:
+    content = input_file.read_bytes()
+    return [content[start:end] for start, end in split_chunks(input_file, chunk_size)]
+
+
+def test_split_chunks_boundary_on_newline(tmp_path):
+    # the 4th byte is a newline, so the first chunk must end right after it
+    input_file = write_input(tmp_path, b"abc\ndef\nghi\n")
+
+    assert read_chunks(input_file, 3) == [b"abc\n", b"def\n", b"ghi\n"]
+
+
+def test_split_chunks_boundary_mid_line(tmp_path):
+    input_file = write_input(tmp_path, b"abcdef\ng\nhijklm\n")
+
+    assert read_chunks(input_file, 2) == [b"abcdef\n", b"g\nhijklm\n"]
+
+
+def test_split_chunks_without_trailing_newline(tmp_path):
+    input_file = write_input(tmp_path, b"ab\ncd\nef")
+
+    chunks = read_chunks(input_file, 4)
+    assert b"".join(chunks) == b"ab\ncd\nef"
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+
+
+def test_split_chunks_empty_file(tmp_path):
+    assert split_chunks(write_input(tmp_path, b""), 4) == []
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b"a\nb\nc\nd\ne\nf\ng\n", "abcdefg"),
+        (b"ab\n\n\ncd\n  \nef\ngh", "abcdefgh"),  # blank lines, no trailing newline
+        (b"abcdefghij\nk\nlmnopqrst\n", "abcdefghijklmnopqrst"),
+    ],
+)
+def test_map_reduce_keeps_order(tmp_path, content, expected):
+    input_file = write_input(tmp_path, content)
+    solution = ConcatSolution(1, 2000, 1, input_file=input_file)
+
+    assert len(split_chunks(input_file, solution.MAP_REDUCE_CHUNK_SIZE)) > 1
+    assert solution._solve_part(1, solution.get_input_data(1)) == expected
+
+
+def test_map_reduce_sums_by_default(tmp_path):
+    input_file = write_input(tmp_path, b"1\n2\n3\n4\n5\n6\n7\n8\n9\n10\n")
+    solution = ConcatSolution(1, 2000, 2, input_file=input_file)
+
+    assert map_reduce(solution, 2, input_file, 3, 2) == 55
+
+
+@pytest.mark.parametrize("content", [b"", b"\n  \n\n"])
+def test_map_reduce_empty_input_returns_initial(tmp_path, content):
+    input_file = write_input(tmp_path, content)
+    solution = ConcatSolution(1, 2000, 1, input_file=input_file)
+
+    assert solution.run().part1.result == ""
+
+
+def test_map_reduce_input_data_is_the_input_path(tmp_path):
+    input_file = write_input(tmp_path, b"a\nb\n")
+
+    assert ConcatSolution(1, 2000, 1, input_file=input_file).input_data == input_file
+
+
+def test_map_reduce_rejects_parse_data():
+    with pytest.raises(TypeError, match="parse_data"):
+
+        class ParsingSolution(Solution):
+            INPUT_PARSER = InputParser.MAP_REDUCE
+
+            def parse_data(self, data):
+                return data
+
+
+def test_map_reduce_uses_a_pool_by_default(tmp_path):
+    input_file = write_input(tmp_path, b"1\n2\n3\n4\n5\n6\n")
+    solution = PidSolution(1, 2000, 1, input_file=input_file)
+
+    assert os.getpid() not in solution.run().part1.result
+
+
+def test_map_reduce_single_worker_runs_in_process(tmp_path):
+    input_file = write_input(tmp_path, b"1\n2\n3\n4\n5\n6\n")
+    solution = PidSolution(1, 2000, 1, input_file=input_file)
+
+    assert map_reduce(solution, 1, input_file, 4, workers=1) == {os.getpid()}
+    assert solution._ticks == len(split_chunks(input_file, 4))
+
+
+def test_map_reduce_in_worker_process_runs_in_process(tmp_path):
+    # e.g. in a worker of verify or of a batch, a pool per worker would oversubscribe
+    input_file = write_input(tmp_path, b"1\n2\n3\n4\n5\n6\n")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        worker_pid, pids = executor.submit(solve_pids, input_file).result()
+
+    assert pids == {worker_pid}
@@ -0,0 +1,53 @@
+import io
+
+from measure_progress_overhead import TickingSolution, measure_overheads
+from rich.console import Console
+
+from utils.progress import ProgressMonitor, format_duration
+
+
+def render_text(monitor: ProgressMonitor) -> str:
+    console = Console(file=io.StringIO(), width=200)
+    console.print(monitor.render())
+    return console.file.getvalue()
+
+
+def test_format_duration():
+    assert format_duration(0) == "0s"
+    assert format_duration(59.9) == "59s"
+    assert format_duration(61) == "1m 01s"
+    assert format_duration(3600 + 2 * 60 + 3) == "1h 02m 03s"
+
+
+def test_render_with_total_shows_eta():
+    solution = TickingSolution()
+    solution.set_progress_total(1000)
+    # a long delay, so that the monitor never displays anything by itself
+    with ProgressMonitor(solution, 1, delay=60) as monitor:
+        monitor.start_time -= 10  # pretend the part started 10 seconds ago
+        monitor.samples[0] = (monitor.start_time, 0)
+        solution.tick(500)
+        text = render_text(monitor)
+
+    assert "Part 1 running..." in text
+    assert "500 / 1,000 (50.0%)" in text
+    assert "50 it/s" in text
+    assert "ETA" in text
+    assert "Stack" in text
+
+
+def test_render_without_total_has_no_eta():
+    solution = TickingSolution()
+    with ProgressMonitor(solution, 2, delay=60) as monitor:
+        solution.tick(500)
+        text = render_text(monitor)
+
+    assert "Part 2 running..." in text
+    assert "Iterations  500" in text
+    assert "ETA" not in text
+
+
+def test_measure_overheads():
+    overheads = measure_overheads(ticks=1000, pairs=2)
+
+    assert len(overheads) == 2
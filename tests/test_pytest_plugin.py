@@ -0,0 +1,42 @@
+import textwrap
+
+BENCHMARKED_TEST = """
+from pathlib import Path
+
+
+def test_sum(benchmark):
+    size = int(Path("size.txt").read_text())
+    benchmark(sum, range(size))
+"""
+
+BENCHMARK_OPTIONS = ["-p", "utils.pytest_plugin", "--benchmark-max-time", "0.05"]
+
+
+def run_sessions(pytester, size: int, sessions: int, *options: str):
+    pytester.makepyfile(test_benchmarked=textwrap.dedent(BENCHMARKED_TEST))
+    pytester.path.joinpath("size.txt").write_text(str(size))
+    return [pytester.runpytest(*BENCHMARK_OPTIONS, *options) for _ in range(sessions)]
+
+
+def test_same_function_in_separate_sessions_is_not_flagged(pytester):
+    for result in run_sessions(pytester, 1000, 3, "--benchmark", "--benchmark-save"):
+        result.assert_outcomes(passed=1)
+
+    (result,) = run_sessions(pytester, 1000, 1, "--benchmark")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*baseline of 3 sessions*"])
+
+
+def test_slowdown_beyond_the_sessions_is_flagged(pytester):
+    run_sessions(pytester, 1000, 3, "--benchmark", "--benchmark-save")
+
+    (result,) = run_sessions(pytester, 100_000, 1, "--benchmark")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*Significant slowdown*"])
+
+
+def test_sessions_are_only_compared_with_benchmark(pytester):
+    run_sessions(pytester, 1000, 3, "--benchmark", "--benchmark-save")
+
+    (result,) = run_sessions(pytester, 100_000, 1)
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,126 @@
+import sys
+from collections import Counter, OrderedDict, defaultdict, deque, namedtuple
+from types import MappingProxyType
+
+import pytest
+
+from conftest import YEAR
+from utils.solution import freeze, get_input_file, get_solution_class
+
+PARSE_COUNTING_SOLUTION = """
+    from utils.solution import Solution
+
+    PARSED = []  # data of every parse_data call
+
+
+    class DaySolution(Solution):
+        def parse_data(self, data):
+            PARSED.append(data)
+            return data
+
+        def solve_part1(self, data):
+            return len(data)
+
+        def solve_part2(self, data):
+            return -len(data)
+"""
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def test_freeze_converts_nested_containers():
+    frozen = freeze([[1, 2], {"a": [3]}, {4, 5}, (6, [7])])
+
+    assert frozen == (
+        (1, 2),
+        MappingProxyType({"a": (3,)}),
+        frozenset({4, 5}),
+        (6, (7,)),
+    )
+    with pytest.raises(TypeError):
+        frozen[1]["b"] = 1
+
+
+def test_freeze_keeps_namedtuples():
+    point = Point(1, 2)
+
+    assert freeze([point])[0] is point
+
+
+def test_freeze_converts_deques_and_subclasses():
+    class Lines(list):
+        pass
+
+    class Seen(set):
+        pass
+
+    assert freeze(deque([1, [2]])) == (1, (2,))
+    assert freeze(Lines([1, 2])) == (1, 2)
+    assert freeze(Seen({1})) == frozenset({1})
+
+
+def test_freeze_keeps_dict_subclasses_behaviour():
+    counter = freeze(Counter("abca"))
+    ordered = freeze(OrderedDict([("b", [1]), ("a", [2])]))
+
+    assert counter["a"] == 2
+    assert counter["z"] == 0  # missing keys of a Counter still count 0
+    assert list(ordered.items()) == [("b", (1,)), ("a", (2,))]
+    with pytest.raises(TypeError):
+        counter["a"] = 3
+    with pytest.raises(TypeError):
+        ordered["c"] = 3
+
+
+def test_freeze_converts_defaultdict_to_plain_dict():
+    data = defaultdict(list, {"a": [1]})
+    frozen = freeze(data)
+
+    assert frozen == {"a": (1,)}
+    with pytest.raises(KeyError):
+        frozen["b"]
+    with pytest.raises(TypeError):
+        frozen["b"] = (2,)
+    assert "b" not in data
+
+
+def test_part_sample_has_priority(aoc_tree):
+    aoc_tree.write_input(1, "a\nb", suffix="_sample")
+    aoc_tree.write_input(1, "a\nb\nc", suffix="_sample_p2")
+
+    assert get_input_file(YEAR, 1, 1, sample=True).name == "day01_sample.txt"
+    assert get_input_file(YEAR, 1, 2, sample=True).name == "day01_sample_p2.txt"
+    assert get_input_file(YEAR, 1, 2).name == "day01.txt"
+
+
+def test_parts_fall_back_to_the_sample(aoc_tree):
+    aoc_tree.write_solution(1, PARSE_COUNTING_SOLUTION)
+    aoc_tree.write_input(1, "a\nb", suffix="_sample")
+
+    solution_report = get_solution_class(1, YEAR)(1, YEAR, sample=True).run()
+
+    assert solution_report.part1.result == 2
+    assert solution_report.part2.result == -2
+
+
+def test_both_parts_share_one_parse(aoc_tree):
+    aoc_tree.write_solution(1, PARSE_COUNTING_SOLUTION)
+    aoc_tree.write_input(1, "a\nb", suffix="_sample")
+
+    DaySolution = get_solution_class(1, YEAR)
+    DaySolution(1, YEAR, sample=True).run()
+
+    assert sys.modules[DaySolution.__module__].PARSED == [["a", "b"]]
+
+
+def test_part2_only_parses_its_own_input(aoc_tree):
+    aoc_tree.write_solution(1, PARSE_COUNTING_SOLUTION)
+    aoc_tree.write_input(1, "a\nb", suffix="_sample")
+    aoc_tree.write_input(1, "a\nb\nc", suffix="_sample_p2")
+
+    DaySolution = get_solution_class(1, YEAR)
+    solution_report = DaySolution(1, YEAR, part=2, sample=True).run()
+
+    assert solution_report.part1 is None
+    assert solution_report.part2.result == -3
+    assert sys.modules[DaySolution.__module__].PARSED == [["a", "b", "c"]]
@@ -0,0 +1,95 @@
+import json
+
+from typer.testing import CliRunner
+
+import app
+from conftest import YEAR
+from utils.answer_store import AnswerStore
+from utils.verification import VERIFY_CACHE_FILE, VerificationStatus, verify
+
+LENGTH_SOLUTION = """
+    from utils.solution import Solution
+
+
+    class DaySolution(Solution):
+        def solve_part1(self, data):
+            return len(data)
+"""
+
+
+def test_answer_store_round_trip(tmp_path):
+    answer_store = AnswerStore(tmp_path)
+    answer_store.record(2024, 1, 1, 123)
+    answer_store.record(2024, 1, 2, "abc")
+    answer_store.record(2024, 1, 1, 7, sample=True)
+
+    assert answer_store.get(2024, 1, 1) == "123"
+    assert answer_store.get(2024, 1, 2) == "abc"
+    assert answer_store.get(2024, 1, 1, sample=True) == "7"
+    assert answer_store.get(2024, 2, 1) is None
+    assert json.loads((tmp_path / "2024.json").read_text()) == {
+        "1": {"1": "123", "2": "abc"}
+    }
+
+    assert answer_store.check(2024, 1, 1, 123) is True
+    assert answer_store.check(2024, 1, 1, "123") is True
+    assert answer_store.check(2024, 1, 1, 124) is False
+    assert answer_store.check(2024, 3, 1, 1) is None
+
+
+def test_verify_reuses_cache_until_sources_or_inputs_change(aoc_tree):
+    aoc_tree.write_solution(1, LENGTH_SOLUTION)
+    aoc_tree.write_input(1, "a\nb\n")
+    AnswerStore().record(YEAR, 1, 1, 2)
+
+    [result] = verify(YEAR)
+    assert (result.status, result.result, result.cached) == ("passed", "2", False)
+
+    [result] = verify(YEAR)
+    assert (result.status, result.cached) == (VerificationStatus.PASSED, True)
+
+    # input change
+    aoc_tree.write_input(1, "a\nb\nc\n")
+    [result] = verify(YEAR)
+    assert (result.status, result.result, result.cached) == ("failed", "3", False)
+
+    # source change
+    aoc_tree.write_solution(1, LENGTH_SOLUTION.replace("len(data)", "len(data) - 1"))
+    [result] = verify(YEAR)
+    assert (result.status, result.result, result.cached) == ("passed", "2", False)
+
+
+def test_verify_ignores_corrupt_cache(aoc_tree):
+    aoc_tree.write_solution(1, LENGTH_SOLUTION)
+    aoc_tree.write_input(1, "a\n")
+    VERIFY_CACHE_FILE.parent.mkdir(parents=True)
+    VERIFY_CACHE_FILE.write_text("{not json")
+
+    [result] = verify(YEAR)
+    assert (result.status, result.cached) == (VerificationStatus.UNKNOWN, False)
+
+
+def test_verify_missing_input_and_error(aoc_tree):
+    aoc_tree.write_solution(1, LENGTH_SOLUTION)
+    aoc_tree.write_solution(
+        2, LENGTH_SOLUTION.replace("return len(data)", "raise ValueError('boom')")
+    )
+    aoc_tree.write_input(2, "a\n")
+
+    missing_input, error = verify(YEAR)
+    assert (missing_input.day, missing_input.status) == (1, "missing_input")
+    assert (error.day, error.status, error.error) == (2, "error", "boom")
+
+
+def test_verify_command_fails_on_wrong_answer(aoc_tree):
+    aoc_tree.write_solution(1, LENGTH_SOLUTION)
+    aoc_tree.write_input(1, "a\n")
+    runner = CliRunner()
+
+    AnswerStore().record(YEAR, 1, 1, 1)
+    assert runner.invoke(app.app, ["verify", "--year", str(YEAR)]).exit_code == 0
+
+    AnswerStore().record(YEAR, 1, 1, 2)
+    result = runner.invoke(app.app, ["verify", "--year", str(YEAR)])
+    assert result.exit_code == 1
+    assert "Failed" in result.output
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+
+class AnswerStore:
+    """Known-correct answers, stored per year in answers/<year>[_sample].json."""
+
+    BASE_DIR = Path("answers")
+
+    def __init__(self, base_dir: Optional[Path] = None):
+        self.base_dir = Path(base_dir) if base_dir else self.BASE_DIR
+
+    def _answers_file(self, year: int, sample: bool) -> Path:
+        file_suffix = "_sample" if sample else ""
+        return self.base_dir / f"{year}{file_suffix}.json"
+
+    def load(self, year: int, sample: bool = False) -> dict[str, dict[str, str]]:
+        answers_file = self._answers_file(year, sample)
+        if not answers_file.exists():
+            return {}
+
+        return json.loads(answers_file.read_text())
+
+    def get(
+        self, year: int, day: int, part: int, sample: bool = False
+    ) -> Optional[str]:
+        return self.load(year, sample).get(str(day), {}).get(str(part))
+
+    def record(
+        self, year: int, day: int, part: int, answer: int | str, sample: bool = False
+    ) -> None:
+        answers = self.load(year, sample)
+        answers.setdefault(str(day), {})[str(part)] = str(answer)
+
+        answers_file = self._answers_file(year, sample)
+        answers_file.parent.mkdir(parents=True, exist_ok=True)
+        answers_file.write_text(json.dumps(answers, indent=4, sort_keys=True) + "\n")
+
+    def check(
+        self, year: int, day: int, part: int, answer: int | str, sample: bool = False
+    ) -> Optional[bool]:
+        """Compare an answer with the recorded one, None if nothing is recorded."""
+        expected = self.get(year, day, part, sample)
+        if expected is None:
+            return None
+
+        return str(answer) == expected
@@ -0,0 +1,83 @@
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from utils.solution import SolutionReport, get_solution_class
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    input_file: Path
+    report: Optional[SolutionReport] = None
+    error: Optional[str] = None
+
+
+def resolve_inputs(inputs: str) -> list[Path]:
+    """Input files from a directory (all its .txt files) or a glob pattern.
+
+    Patterns are recursive: `**` matches any number of directories.
+    """
+    if Path(inputs).is_dir():
+        return sorted(Path(inputs).glob("*.txt"))
+
+    return sorted(
+        Path(input_file)
+        for input_file in glob.glob(inputs, recursive=True)
+        if Path(input_file).is_file()
+    )
+
+
+def solve_input(
+    day: int, year: int, part: Optional[int], input_file: Path, progress: bool = False
+) -> BatchResult:
+    # note: executed in worker processes too, so it must stay a module-level function
+    try:
+        # the module is only imported once per process, so caches stay warm
+        DaySolution = get_solution_class(day, year)
+        solution = DaySolution(
+            day, year, part, progress=progress, input_file=input_file
+        )
+        return BatchResult(input_file, report=solution.run())
+    except Exception as e:
+        return BatchResult(input_file, error=str(e))
+
+
+def run_batch(
+    day: int,
+    year: int,
+    part: Optional[int],
+    input_files: list[Path],
+    workers: int = 1,
+    progress: bool = False,
+) -> tuple[list[BatchResult], float]:
+    """Solve a day against many input files, returning results and total time.
+
+    With a single worker, every input is solved in the current process, one after
+    the other (with live progress if asked); otherwise inputs are spread over a
+    process pool.
+    """
+    # fail before starting any worker if the solution does not exist
+    get_solution_class(day, year)
+
+    start_time = time.perf_counter()
+    if workers == 1:
+        batch_results = [
+            solve_input(day, year, part, input_file, progress)
+            for input_file in input_files
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batch_results = list(
+                executor.map(
+                    solve_input,
+                    [day] * len(input_files),
+                    [year] * len(input_files),
+                    [part] * len(input_files),
+                    input_files,
+                )
+            )
+
+    return batch_results, time.perf_counter() - start_time
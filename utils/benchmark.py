@@ -0,0 +1,203 @@
+import gc
+import json
+import math
+import statistics
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+
+def timing_buffer(size: int = 0) -> array:
+    """Compact buffer of timings (C doubles), instead of a list of float objects."""
+    return array("d", bytes(8 * size))
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkStats:
+    samples: array  # time per iteration of each kept round, in seconds
+    iterations: int  # iterations per round
+    outliers: int = 0  # number of rejected rounds
+
+    @property
+    def rounds(self) -> int:
+        return len(self.samples)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    ratio: float  # current median / median of the baseline sessions
+    p_value: float  # probability of such a median if the code did not change
+    slower: bool  # slowdown beyond the spread of the baseline sessions
+    sessions: int  # number of baseline sessions compared with
+
+
+def reject_outliers(samples: array) -> array:
+    """Drop samples outside of the Tukey fences (1.5 IQR from the quartiles)."""
+    if len(samples) < 4:
+        return samples
+
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    return array("d", (sample for sample in samples if low <= sample <= high))
+
+
+MIN_BASELINE_SESSIONS = 3
+
+
+def compare(
+    baseline_medians: Sequence[float],
+    current_median: float,
+    alpha: float = 0.01,
+    threshold: float = 1.0,
+) -> BenchmarkComparison:
+    """Compare the median of this session with the medians of the saved sessions.
+
+    Timings drift much more between sessions (CPU frequency, load, ...) than
+    between rounds of one session, so rounds of different sessions are not
+    comparable samples. A slowdown is only flagged when the current median is
+    beyond the spread of at least MIN_BASELINE_SESSIONS saved sessions: more than
+    `threshold` above the slowest of them, and unlikely (p < alpha) under a normal
+    model of the session medians.
+    """
+    ratio = current_median / statistics.median(baseline_medians)
+
+    if len(baseline_medians) < 2:
+        p_value = 1.0
+    else:
+        mean = statistics.fmean(baseline_medians)
+        stdev = statistics.stdev(baseline_medians)
+        if stdev > 0:
+            p_value = 1 - statistics.NormalDist(mean, stdev).cdf(current_median)
+        else:
+            p_value = 0.0 if current_median > mean else 1.0
+
+    slower = (
+        len(baseline_medians) >= MIN_BASELINE_SESSIONS
+        and p_value < alpha
+        and current_median > max(baseline_medians) * (1 + threshold)
+    )
+
+    return BenchmarkComparison(
+        ratio=ratio, p_value=p_value, slower=slower, sessions=len(baseline_medians)
+    )
+
+
+class Benchmark:
+    """Time a function over calibrated rounds, with GC disabled while timing."""
+
+    def __init__(
+        self,
+        max_time: float = 1.0,
+        min_rounds: int = 10,
+        max_rounds: int = 1000,
+        min_round_time: float = 0.005,
+        disable_gc: bool = True,
+    ):
+        self.max_time = max_time
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.min_round_time = min_round_time
+        self.disable_gc = disable_gc
+
+    def _time_round(self, func: Callable[[], Any], iterations: int) -> float:
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return time.perf_counter() - start_time
+
+    def _calibrate(self, func: Callable[[], Any]) -> tuple[int, float]:
+        """Find how many iterations make a round last at least min_round_time.
+
+        This also warms up the function (caches, lazy imports, ...).
+        """
+        iterations = 1
+        while True:
+            round_time = self._time_round(func, iterations)
+            if round_time >= self.min_round_time:
+                return iterations, round_time
+            # aim directly at the target, but at least double the iterations
+            iterations = max(
+                iterations * 2,
+                math.ceil(iterations * self.min_round_time / max(round_time, 1e-9)),
+            )
+
+    def __call__(self, func: Callable, *args, **kwargs) -> BenchmarkStats:
+        def target():
+            return func(*args, **kwargs)
+
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        if self.disable_gc:
+            gc.disable()
+
+        try:
+            iterations, round_time = self._calibrate(target)
+            rounds = min(
+                self.max_rounds,
+                max(self.min_rounds, int(self.max_time / round_time)),
+            )
+            samples = timing_buffer(rounds)
+            for round_index in range(rounds):
+                samples[round_index] = self._time_round(target, iterations) / iterations
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        kept_samples = reject_outliers(samples)
+
+        return BenchmarkStats(
+            samples=kept_samples,
+            iterations=iterations,
+            outliers=len(samples) - len(kept_samples),
+        )
+
+
+class BaselineStore:
+    """Medians of the last MAX_SESSIONS saved sessions of each benchmark."""
+
+    BASELINE_FILE = Path(".aoc_cache/benchmark_sessions.json")
+    MAX_SESSIONS = 10
+
+    def __init__(self, baseline_file: Optional[Path] = None):
+        self.baseline_file = (
+            Path(baseline_file) if baseline_file else self.BASELINE_FILE
+        )
+        self.baselines = {}
+        if self.baseline_file.exists():
+            # an unreadable file only loses the baselines
+            try:
+                self.baselines = json.loads(self.baseline_file.read_text())
+            except (OSError, ValueError):
+                self.baselines = {}
+
+    def get(self, key: str) -> list[float]:
+        return self.baselines.get(key, [])
+
+    def add(self, key: str, median: float) -> None:
+        sessions = self.baselines.setdefault(key, [])
+        sessions.append(median)
+        del sessions[: -self.MAX_SESSIONS]
+
+    def save(self) -> None:
+        self.baseline_file.parent.mkdir(parents=True, exist_ok=True)
+        self.baseline_file.write_text(json.dumps(self.baselines, indent=4))
@@ -2,7 +2,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+from utils.batch import BatchResult
 from utils.solution import SolutionReport, SubmissionResult
+from utils.verification import VerificationResult, VerificationStatus
 
 console = Console()
 
@@ -64,6 +66,96 @@ def create_report(solution_report: SolutionReport) -> None:
     print(table)
 
 
+def create_batch_report(
+    day: int, year: int, batch_results: list[BatchResult], total_time: float
+) -> None:
+    table = Table(title=f"Solutions for day {day}, year {year}")
+    table.add_column("Input", style="cyan")
+    for part in [1, 2]:
+        table.add_column(f"Part {part}", style="green")
+        table.add_column("Time", style="magenta")
+
+    for batch_result in batch_results:
+        columns = [str(batch_result.input_file)]
+        if batch_result.error:
+            columns.append(Text(batch_result.error, style="red"))
+        else:
+            for solution_part_report in [
+                batch_result.report.part1,
+                batch_result.report.part2,
+            ]:
+                if solution_part_report:
+                    columns += [
+                        str(solution_part_report.result),
+                        f"{solution_part_report.time_taken * 1000:.3f} ms",
+                    ]
+                else:
+                    columns += ["-", "-"]
+
+        table.add_row(*columns)
+
+    print(table)
+    errors = sum(1 for batch_result in batch_results if batch_result.error)
+    print_dim(
+        f"{len(batch_results) - errors} inputs solved, {errors} errors, "
+        f"in {total_time:.3f} s ({len(batch_results) / total_time:.1f} inputs/s)"
+    )
+
+
+def create_verification_report(verification_results: list[VerificationResult]) -> None:
+    table = Table(title="Verification of recorded answers")
+    table.add_column("Year", style="cyan")
+    table.add_column("Day", style="cyan")
+    table.add_column("Part", style="cyan")
+    table.add_column("Result", style="green")
+    table.add_column("Expected", style="green")
+    table.add_column("Status")
+    table.add_column("Time", style="magenta")
+
+    for verification_result in verification_results:
+        if verification_result.time_taken is None:
+            time_taken = "-"
+        else:
+            time_taken = f"{verification_result.time_taken * 1000:.3f} ms"
+            if verification_result.cached:
+                time_taken += " (cached)"
+
+        table.add_row(
+            str(verification_result.year),
+            str(verification_result.day),
+            str(verification_result.part or "-"),
+            verification_result.result or verification_result.error or "-",
+            verification_result.expected or "-",
+            format_verification_status(verification_result.status),
+            time_taken,
+        )
+
+    print(table)
+
+
+def format_verification_status(verification_status: VerificationStatus) -> Text:
+    text = Text()
+
+    match verification_status:
+        case VerificationStatus.PASSED:
+            text.append("✨ ", style="bright_yellow")
+            text.append("Passed", style="bright_green")
+        case VerificationStatus.FAILED:
+            text.append("❌ ", style="bright_red")
+            text.append("Failed", style="red")
+        case VerificationStatus.UNKNOWN:
+            text.append("❔ ", style="bright_yellow")
+            text.append("No recorded answer", style="yellow")
+        case VerificationStatus.MISSING_INPUT:
+            text.append("📭 ", style="bright_yellow")
+            text.append("Missing input", style="yellow")
+        case _:
+            text.append("⚠️ ", style="bright_yellow")
+            text.append("Error", style="red")
+
+    return text
+
+
 def format_submission_result(submission_result: SubmissionResult) -> Text:
     text = Text()
 
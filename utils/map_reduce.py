@@ -0,0 +1,95 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from pathlib import Path
+from typing import Any, Optional
+
+
+def split_chunks(input_file: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a file into (start, end) byte ranges, each ending on a line boundary."""
+    file_size = input_file.stat().st_size
+    chunks = []
+
+    with open(input_file, "rb") as file:
+        start = 0
+        while start < file_size:
+            file.seek(min(start + chunk_size, file_size))
+            file.readline()  # move to the end of the current line
+            end = min(file.tell(), file_size)
+            chunks.append((start, end))
+            start = end
+
+    return chunks
+
+
+def map_reduce_chunk(
+    solution, part: int, input_file: Path, start: int, end: int
+) -> tuple[bool, Any]:
+    """Map and reduce the lines of a chunk, also returning if it had any line."""
+    # note: executed in a worker process, so it must stay a module-level function
+    with open(input_file, "rb") as file:
+        file.seek(start)
+        chunk = file.read(end - start).decode()
+
+    map_line = getattr(solution, f"map_part{part}")
+    reduce_results = getattr(solution, f"reduce_part{part}")
+
+    values = (
+        map_line(solution.parse_line(line))
+        for line in chunk.splitlines()
+        if line.strip()
+    )
+    no_value = object()
+    result = next(values, no_value)
+    if result is no_value:
+        return False, None
+
+    return True, reduce(reduce_results, values, result)
+
+
+def map_reduce(
+    solution,
+    part: int,
+    input_file: Path,
+    chunk_size: int,
+    workers: Optional[int] = None,
+) -> Any:
+    """Map each line of the input and reduce the results, over a process pool.
+
+    The reduce function must be associative: chunks are reduced in parallel, then
+    their partial results are merged in order. By default, there is one process per
+    CPU, or none when already running in a worker process (of verify or of a batch
+    of inputs), which would otherwise oversubscribe the CPUs.
+    """
+    chunks = split_chunks(input_file, chunk_size)
+    solution.set_progress_total(len(chunks))
+
+    if workers is None and multiprocessing.parent_process() is not None:
+        workers = 1
+
+    # small inputs are not worth starting a process pool
+    if len(chunks) <= 1 or workers == 1:
+        partial_results = []
+        for start, end in chunks:
+            partial_results.append(
+                map_reduce_chunk(solution, part, input_file, start, end)
+            )
+            solution.tick()
+    else:
+        partial_results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    map_reduce_chunk, solution, part, input_file, start, end
+                )
+                for start, end in chunks
+            ]
+            for future in futures:
+                partial_results.append(future.result())
+                solution.tick()
+
+    results = [result for has_result, result in partial_results if has_result]
+    if not results:
+        return solution.MAP_REDUCE_INITIAL
+
+    return reduce(getattr(solution, f"reduce_part{part}"), results)
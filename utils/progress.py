@@ -0,0 +1,119 @@
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressMonitor:
+    """Sample the progress of a running part from a background thread.
+
+    The solving thread only increments a counter (see `Solution.tick`), the
+    sampling thread reads it along with the current stack of the solving thread
+    every `interval` seconds and renders them in a live panel.
+    """
+
+    def __init__(
+        self,
+        solution,
+        part: int,
+        interval: float = 1.0,
+        delay: float = 0.5,
+        stack_depth: int = 8,
+        console: Optional[Console] = None,
+    ):
+        self.solution = solution
+        self.part = part
+        self.interval = interval
+        self.delay = delay  # parts faster than this are never displayed
+        self.stack_depth = stack_depth
+        self.console = console  # rich's global console by default
+        self.thread_id = threading.get_ident()
+        self.samples = deque(maxlen=10)  # (time, ticks), to smooth the speed
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._live: Optional[Live] = None
+
+    def __enter__(self) -> "ProgressMonitor":
+        self.start_time = time.perf_counter()
+        self.samples.append((self.start_time, self.solution._ticks))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        if self._live:
+            self._live.stop()
+
+    def _run(self) -> None:
+        if self._stop.wait(self.delay):
+            return
+
+        self._live = Live(console=self.console, auto_refresh=False, transient=True)
+        self._live.start()
+        while True:
+            self._live.update(self.render(), refresh=True)
+            if self._stop.wait(self.interval):
+                break
+
+    def current_stack(self) -> list[traceback.FrameSummary]:
+        """Stack of the solving thread, starting from the solve_partN call."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return []
+
+        stack = traceback.extract_stack(frame)
+        for index, frame_summary in enumerate(stack):
+            if frame_summary.name == "_run_part":
+                stack = stack[index + 1 :]
+                break
+
+        return stack[-self.stack_depth :]
+
+    def render(self) -> Panel:
+        now = time.perf_counter()
+        ticks = self.solution._ticks
+        total = self.solution._progress_total
+        self.samples.append((now, ticks))
+
+        elapsed = now - self.start_time
+        first_time, first_ticks = self.samples[0]
+        speed = (ticks - first_ticks) / (now - first_time) if now > first_time else 0.0
+
+        table = Table.grid(padding=(0, 2))
+        table.add_column(style="cyan")
+        table.add_column()
+        table.add_row("Elapsed", format_duration(elapsed))
+        if total:
+            table.add_row("Iterations", f"{ticks:,} / {total:,} ({ticks / total:.1%})")
+        else:
+            table.add_row("Iterations", f"{ticks:,}")
+        table.add_row("Speed", f"{speed:,.0f} it/s")
+        if total and speed > 0:
+            table.add_row("ETA", format_duration(max(total - ticks, 0) / speed))
+
+        for index, frame_summary in enumerate(reversed(self.current_stack())):
+            table.add_row(
+                "Stack" if index == 0 else "",
+                f"[magenta]{frame_summary.name}[/magenta] "
+                f"[dim]{frame_summary.filename}:{frame_summary.lineno}[/dim]",
+            )
+
+        return Panel(table, title=f"Part {self.part} running...", expand=False)
@@ -0,0 +1,212 @@
+"""Pytest plugin checking and benchmarking every solutions/<year>/dayXX.py.
+
+Each solution file is collected as one test per part and per input (sample and
+real), so that `pytest -k 2024` checks every 2024 answer against the answer store.
+With `--benchmark`, each part is also timed and compared with the saved sessions.
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from utils.answer_store import AnswerStore
+from utils.benchmark import BaselineStore, Benchmark, BenchmarkStats, compare
+from utils.solution import Solution, solution_factory
+
+SOLUTION_PATH_PATTERN = re.compile(r"solutions/(\d{4})/day(\d{2})\.py")
+
+baseline_store_key = pytest.StashKey[BaselineStore]()
+benchmark_results_key = pytest.StashKey[list]()
+
+
+class SolutionCheckError(Exception):
+    pass
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("aoc", "Advent of Code solutions")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Benchmark each solution part and compare with the stored baseline",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="Add the benchmark results to the saved baseline sessions",
+    )
+    group.addoption(
+        "--benchmark-max-time",
+        type=float,
+        default=1.0,
+        help="Maximum time spent benchmarking each part, in seconds (default: 1.0)",
+    )
+    group.addoption(
+        "--benchmark-alpha",
+        type=float,
+        default=0.01,
+        help="Significance level of a slowdown (default: 0.01)",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=1.0,
+        help="Minimum slowdown above the slowest saved session (default: 1.0)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[baseline_store_key] = BaselineStore(
+        config.rootpath / BaselineStore.BASELINE_FILE
+    )
+    config.stash[benchmark_results_key] = []
+
+
+def pytest_collect_file(file_path: Path, parent: pytest.Collector):
+    relative_path = file_path.relative_to(parent.config.rootpath).as_posix()
+    match = SOLUTION_PATH_PATTERN.fullmatch(relative_path)
+    if match:
+        year, day = int(match.group(1)), int(match.group(2))
+        return SolutionFile.from_parent(parent, path=file_path, year=year, day=day)
+
+
+def check_benchmark(config: pytest.Config, key: str, stats: BenchmarkStats) -> None:
+    """Compare with (or add to) the saved sessions, failing on a slowdown."""
+    baseline_store = config.stash[baseline_store_key]
+    baseline_medians = baseline_store.get(key)
+    comparison = None
+    if baseline_medians:
+        comparison = compare(
+            baseline_medians,
+            stats.median,
+            alpha=config.getoption("benchmark_alpha"),
+            threshold=config.getoption("benchmark_threshold"),
+        )
+    config.stash[benchmark_results_key].append((key, stats, comparison))
+
+    if config.getoption("benchmark_save"):
+        baseline_store.add(key, stats.median)
+    elif comparison and comparison.slower:
+        raise SolutionCheckError(
+            f"Significant slowdown: {comparison.ratio:.2f}x the baseline, beyond the "
+            f"spread of {comparison.sessions} saved sessions "
+            f"(p={comparison.p_value:.4f})"
+        )
+
+
+class SolutionFile(pytest.File):
+    def __init__(self, *, year: int, day: int, **kwargs):
+        super().__init__(**kwargs)
+        self.year = year
+        self.day = day
+
+    def collect(self):
+        for sample in [True, False]:
+            input_name = "sample" if sample else "input"
+            for part in [1, 2]:
+                yield SolutionItem.from_parent(
+                    self,
+                    name=f"part{part}[{self.year}-day{self.day:02d}-{input_name}]",
+                    part=part,
+                    sample=sample,
+                )
+
+
+class SolutionItem(pytest.Item):
+    def __init__(self, *, part: int, sample: bool, **kwargs):
+        super().__init__(**kwargs)
+        self.year = self.parent.year
+        self.day = self.parent.day
+        self.part = part
+        self.sample = sample
+
+    def _create_solution(self) -> Solution:
+        try:
+            return solution_factory(self.day, self.year, self.part, self.sample, False)
+        except FileNotFoundError as e:
+            pytest.skip(str(e))
+
+    def runtest(self) -> None:
+        solution = self._create_solution()
+        solution_part_report = solution._run_part(self.part, False)
+        if solution_part_report is None:
+            pytest.skip(f"Part {self.part} not implemented")
+
+        expected = AnswerStore().get(self.year, self.day, self.part, self.sample)
+        if expected is not None and str(solution_part_report.result) != expected:
+            raise SolutionCheckError(
+                f"Wrong answer: got {solution_part_report.result}, expected {expected}"
+            )
+
+        if self.config.getoption("benchmark"):
+            benchmark = Benchmark(max_time=self.config.getoption("benchmark_max_time"))
+            stats = benchmark(
+                solution._solve_part, self.part, solution.get_input_data(self.part)
+            )
+            check_benchmark(self.config, self.nodeid, stats)
+        elif expected is None:
+            pytest.skip("No recorded answer, run 'aoc record' to add one")
+
+    def repr_failure(self, excinfo: pytest.ExceptionInfo) -> str:
+        if isinstance(excinfo.value, SolutionCheckError):
+            return str(excinfo.value)
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self) -> tuple[Path, Optional[int], str]:
+        input_name = "sample" if self.sample else "input"
+        return (
+            self.path,
+            None,
+            f"{self.year} day {self.day} part {self.part} ({input_name})",
+        )
+
+
+class BenchmarkFixture:
+    """Callable returned by the `benchmark` fixture, for hand-written tests.
+
+    The function is always timed, but only compared with the saved sessions (or
+    added to them) with `--benchmark`, like solution parts.
+    """
+
+    def __init__(self, request: pytest.FixtureRequest):
+        self.config = request.config
+        self.key = request.node.nodeid
+
+    def __call__(self, func, *args, **kwargs) -> BenchmarkStats:
+        benchmark = Benchmark(max_time=self.config.getoption("benchmark_max_time"))
+        stats = benchmark(func, *args, **kwargs)
+        if self.config.getoption("benchmark"):
+            check_benchmark(self.config, self.key, stats)
+        return stats
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> BenchmarkFixture:
+    return BenchmarkFixture(request)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if session.config.getoption("benchmark_save"):
+        session.config.stash[baseline_store_key].save()
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    benchmark_results = config.stash[benchmark_results_key]
+    if not benchmark_results:
+        return
+
+    terminalreporter.section("benchmark")
+    for key, stats, comparison in benchmark_results:
+        line = (
+            f"{key}: median {stats.median * 1000:.3f} ms "
+            f"(min {stats.min * 1000:.3f} ms, stdev {stats.stdev * 1000:.3f} ms, "
+            f"{stats.rounds} rounds x {stats.iterations}, {stats.outliers} outliers)"
+        )
+        if comparison:
+            line += (
+                f", {comparison.ratio:.2f}x baseline of {comparison.sessions} sessions "
+                f"(p={comparison.p_value:.4f})"
+            )
+        terminalreporter.write_line(line)
@@ -1,18 +1,22 @@
 import contextlib
+import copy
 import importlib
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional, Union
 
+from utils.answer_store import AnswerStore
 from utils.aoc_client import AOCClient, SubmissionResult
+from utils.map_reduce import map_reduce
+from utils.progress import ProgressMonitor
 
 
-def solution_factory(
-    day: int, year: int, part: int, sample: bool, submit: bool
-) -> "Solution":
+def get_solution_class(day: int, year: int) -> type["Solution"]:
     module_path = f"solutions.{year}.day{day:02d}"
 
     try:
@@ -23,19 +27,37 @@ def solution_factory(
     except AttributeError as e:
         raise ImportError(f"No 'DaySolution' class in {module_path}") from e
 
-    return DaySolution(day, year, part, sample, submit)
+    return DaySolution
+
+
+def solution_factory(
+    day: int,
+    year: int,
+    part: int,
+    sample: bool,
+    submit: bool,
+    progress: bool = False,
+    input_file: Optional[Path] = None,
+) -> "Solution":
+    DaySolution = get_solution_class(day, year)
 
+    return DaySolution(day, year, part, sample, submit, progress, input_file)
 
-@dataclass
+
+# note: reports are frozen since they are never modified once a part has run, and
+# slotted to avoid a per-instance __dict__
+
+
+@dataclass(frozen=True, slots=True)
 class SolutionPartReport:
     part: int
     result: Optional[Union[int]] = None
-    time_taken: Optional[int] = None
+    time_taken: Optional[float] = None
     submission: Optional[SubmissionResult] = None
     error: Optional[Exception] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SolutionReport:
     submit: Optional[bool] = False
     day: Optional[int] = None
@@ -43,19 +65,14 @@ class SolutionReport:
     part1: Optional[SolutionPartReport] = None
     part2: Optional[SolutionPartReport] = None
 
-    def __setitem__(self, key: str, value: SolutionPartReport):
-        if key == 1:
-            self.part1 = value
-        elif key == 2:
-            self.part2 = value
-        else:
-            raise KeyError(f"Invalid key: {key}")
-
 
 class InputParser(Enum):
     ONE_LINE = "one line"
     MULTIPLE_LINES = "multiple lines"
     N_COLUMNS = "n columns"  # you must specify the types of the columns in COLUMN_TYPES
+    # you must implement map_partN (and reduce_partN): lines are only parsed with
+    # parse_line (overriding parse_data is an error), and input_data is the input Path
+    MAP_REDUCE = "map reduce"
 
 
 def get_latest_year() -> int:
@@ -64,9 +81,59 @@ def get_latest_year() -> int:
     return year if now.month == 12 else year - 1
 
 
+def get_input_file(year: int, day: int, part: int, sample: bool = False) -> Path:
+    """Input file of a part, preferring a part-specific sample (dayXX_sample_p2.txt)."""
+    if sample:
+        part_sample_file = Path(f"inputs/{year}/day{day:02d}_sample_p{part}.txt")
+        if part_sample_file.exists():
+            return part_sample_file
+
+    file_suffix = "_sample" if sample else ""
+    return Path(f"inputs/{year}/day{day:02d}{file_suffix}.txt")
+
+
+def freeze(data: Any) -> Any:
+    """Recursively convert data to read-only structures, so parts can share it."""
+    # note: exact tuple check, so that namedtuples are kept as is
+    if type(data) is tuple or isinstance(data, (list, deque)):
+        return tuple(freeze(item) for item in data)
+    if isinstance(data, defaultdict):
+        # a defaultdict inserts missing keys on lookup, so it becomes a plain dict
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, dict):
+        # a copy keeps the behaviour of subclasses (Counter, OrderedDict, ...)
+        frozen = copy.copy(data)
+        for key, value in data.items():
+            frozen[key] = freeze(value)
+        return MappingProxyType(frozen)
+    if isinstance(data, set):
+        return frozenset(data)
+    if hasattr(data, "setflags"):  # numpy arrays
+        data.setflags(write=False)
+
+    return data
+
+
 class Solution:
     INPUT_PARSER = InputParser.MULTIPLE_LINES
     COLUMN_TYPES = []  # when using N_COLUMNS parser
+    MAP_REDUCE_CHUNK_SIZE = 1 << 20  # bytes per chunk, when using MAP_REDUCE parser
+    MAP_REDUCE_WORKERS = None  # number of processes, defaults to the number of CPUs
+    # (or to 1 when already running in a worker process, e.g. of verify or --inputs)
+    MAP_REDUCE_INITIAL = 0  # identity of reduce_partN, result of an empty input
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the whole input is never loaded with MAP_REDUCE, so parse_data would be
+        # silently skipped
+        if (
+            cls.INPUT_PARSER == InputParser.MAP_REDUCE
+            and cls.parse_data is not Solution.parse_data
+        ):
+            raise TypeError(
+                f"{cls.__name__} uses the MAP_REDUCE parser, which never calls "
+                "parse_data: parse each line in parse_line instead"
+            )
 
     def __init__(
         self,
@@ -75,15 +142,32 @@ class Solution:
         part: Optional[int] = None,
         sample: Optional[bool] = False,
         submit: Optional[bool] = False,
+        progress: Optional[bool] = False,
+        input_file: Optional[Path] = None,
     ):
         self.day = day
         self.year = year or get_latest_year()
         self.parts = [part] if part else [1, 2]
         self.sample = sample
         self.submit = submit
-        self.input_data = self._load_input_data(
-            sample
-        )  # note: input data should be loaded at runtime because of possible sample change between part 1 and part 2
+        self.progress = progress  # display a live progress panel while solving
+        self.input_file = input_file  # overrides inputs/<year>/dayXX.txt for all parts
+        self._input_data = {}  # parsed data, per input file
+        self._ticks = 0
+        self._progress_total = None
+
+        # fail early on missing inputs, but only parse them when a part needs them
+        for run_part in self.parts:
+            part_input_file = self._input_file(run_part)
+            if not part_input_file.exists():
+                raise FileNotFoundError(
+                    f"Input file not found: {part_input_file}. Please run 'create' command first."
+                )
+
+    @property
+    def input_data(self) -> Any:
+        """Input data of the first part to run."""
+        return self.get_input_data(self.parts[0])
 
     # Methods that should be implemented by subclasses
 
@@ -101,16 +185,52 @@ class Solution:
         """Solve part 2 of the puzzle."""
         raise NotImplementedError("Part 2 not implemented")
 
+    def map_part1(self, line: Any) -> Any:
+        """Map a parsed line to its part 1 result, when using MAP_REDUCE parser."""
+        raise NotImplementedError("Part 1 not implemented")
+
+    def map_part2(self, line: Any) -> Any:
+        """Map a parsed line to its part 2 result, when using MAP_REDUCE parser."""
+        raise NotImplementedError("Part 2 not implemented")
+
+    def reduce_part1(self, left: Any, right: Any) -> Any:
+        """Merge two part 1 results, must be associative."""
+        return left + right
+
+    def reduce_part2(self, left: Any, right: Any) -> Any:
+        """Merge two part 2 results, must be associative."""
+        return left + right
+
+    # Instrumentation that can be used by subclasses in long-running parts
+
+    def tick(self, count: int = 1) -> None:
+        """Count iterations of a hot loop, displayed live with --progress."""
+        self._ticks += count
+
+    def set_progress_total(self, total: int) -> None:
+        """Set the expected number of ticks, to get an ETA with --progress."""
+        self._progress_total = total
+
     # ---
 
-    def _load_input_data(self, sample: bool = False) -> list[str] | str:
-        file_suffix = "_sample" if sample else ""
-        input_file = Path(f"inputs/{self.year}/day{self.day:02d}{file_suffix}.txt")
+    def _input_file(self, part: int) -> Path:
+        if self.input_file:
+            return Path(self.input_file)
 
-        if not input_file.exists():
-            raise FileNotFoundError(
-                f"Input file not found: {input_file}. Please run 'create' command first."
-            )
+        return get_input_file(self.year, self.day, part, self.sample)
+
+    def get_input_data(self, part: int) -> Any:
+        """Read-only input data of a part, parsed once and shared between parts."""
+        input_file = self._input_file(part)
+        if input_file not in self._input_data:
+            self._input_data[input_file] = self._load_input_data(input_file)
+
+        return self._input_data[input_file]
+
+    def _load_input_data(self, input_file: Path) -> Any:
+        # lines are read by chunks in worker processes when solving
+        if self.INPUT_PARSER == InputParser.MAP_REDUCE:
+            return input_file
 
         match self.INPUT_PARSER:
             case InputParser.ONE_LINE:
@@ -138,39 +258,60 @@ class Solution:
         with contextlib.suppress(NotImplementedError):
             data = self.parse_data(data)
 
-        return data
-
-    def _run_part(self, part: int, submit: bool) -> SolutionPartReport:
-        solution_part_report = SolutionPartReport(part)
+        return freeze(data)
 
-        try:
-            start_time = time.time()
-            solution_part_report.result = getattr(self, f"solve_part{part}")(
-                self.input_data
+    def _solve_part(self, part: int, input_data: Any) -> Any:
+        if self.INPUT_PARSER == InputParser.MAP_REDUCE:
+            return map_reduce(
+                self,
+                part,
+                input_data,
+                self.MAP_REDUCE_CHUNK_SIZE,
+                self.MAP_REDUCE_WORKERS,
             )
-            end_time = time.time()
-            solution_part_report.time_taken = end_time - start_time
 
-            if submit:
-                solution_part_report.submission = self.submit_solution(
-                    part, solution_part_report.result
-                )
+        return getattr(self, f"solve_part{part}")(input_data)
+
+    def _run_part(self, part: int, submit: bool) -> Optional[SolutionPartReport]:
+        input_data = self.get_input_data(part)
+        self._ticks = 0
+        self._progress_total = None
+
+        try:
+            with (
+                ProgressMonitor(self, part)
+                if self.progress
+                else contextlib.nullcontext()
+            ):
+                start_time = time.time()
+                result = self._solve_part(part, input_data)
+                end_time = time.time()
         except NotImplementedError:
             return None
 
-        return solution_part_report
+        submission = self.submit_solution(part, result) if submit else None
+
+        return SolutionPartReport(part, result, end_time - start_time, submission)
 
     def run(self) -> SolutionReport:
-        solution_report = SolutionReport(
-            day=self.day, year=self.year, submit=self.submit
+        solution_part_reports = {
+            part: self._run_part(part, self.submit) for part in self.parts
+        }
+
+        return SolutionReport(
+            day=self.day,
+            year=self.year,
+            submit=self.submit,
+            part1=solution_part_reports.get(1),
+            part2=solution_part_reports.get(2),
         )
-        for part in self.parts:
-            solution_report[part] = self._run_part(part, self.submit)
-
-        return solution_report
 
     def submit_solution(self, part: int, answer: int) -> SubmissionResult:
         client = AOCClient()
         result = client.submit_answer(self.year, self.day, part, answer)
 
+        # keep track of correct answers so that they can be verified later on
+        if result == SubmissionResult.CORRECT:
+            AnswerStore().record(self.year, self.day, part, answer)
+
         return result
@@ -15,6 +15,8 @@ class DaySolution(Solution):
         return line
 
     def solve_part1(self, data: Any) -> int:
+        # note: data is read-only (tuples instead of lists and deques, read-only
+        # dicts, including defaultdicts without default), copy it before mutating it
         # Your part 1 logic here
         raise NotImplementedError("Part 1 not implemented")
 
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Optional
+
+from utils.answer_store import AnswerStore
+from utils.solution import get_input_file, solution_factory
+
+SOLUTION_FILE_PATTERN = re.compile(r"day(\d{2})\.py")
+VERIFY_CACHE_FILE = Path(".aoc_cache/verify.json")
+
+
+class VerificationStatus(StrEnum):
+    PASSED = "passed"
+    FAILED = "failed"
+    UNKNOWN = "unknown"  # no recorded answer to compare with
+    MISSING_INPUT = "missing_input"
+    ERROR = "error"
+
+
+@dataclass(slots=True)
+class VerificationResult:
+    year: int
+    day: int
+    part: Optional[int] = None  # None when the whole day could not be run
+    result: Optional[str] = None
+    expected: Optional[str] = None
+    time_taken: Optional[float] = None
+    status: Optional[VerificationStatus] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+
+def discover_solutions(year: Optional[int] = None) -> list[tuple[int, int]]:
+    """List (year, day) of every implemented solution, optionally for one year."""
+    solutions = []
+    for solution_file in Path("solutions").glob("*/day*.py"):
+        match = SOLUTION_FILE_PATTERN.fullmatch(solution_file.name)
+        if not match or not solution_file.parent.name.isdigit():
+            continue
+
+        solution_year = int(solution_file.parent.name)
+        if year is None or solution_year == year:
+            solutions.append((solution_year, int(match.group(1))))
+
+    return sorted(solutions)
+
+
+def _fingerprint(year: int, day: int, sample: bool) -> Optional[str]:
+    """Hash everything the results of a day depend on, None if the input is missing."""
+    input_files = {get_input_file(year, day, part, sample) for part in [1, 2]}
+    if not all(input_file.exists() for input_file in input_files):
+        return None
+
+    # note: every shared module is hashed (not only utils/solution.py), since results
+    # also depend on helpers such as utils/map_reduce.py or solutions/<year>/ modules
+    digest = hashlib.sha256()
+    for path in [
+        *sorted(Path("utils").glob("*.py")),
+        *sorted(Path(f"solutions/{year}").glob("*.py")),
+        *sorted(input_files),
+    ]:
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def _run_day(year: int, day: int, sample: bool) -> list[VerificationResult]:
+    # note: executed in a worker process, so it must stay a module-level function
+    try:
+        solution_report = solution_factory(day, year, None, sample, False).run()
+    except Exception as e:
+        return [
+            VerificationResult(year, day, status=VerificationStatus.ERROR, error=str(e))
+        ]
+
+    return [
+        VerificationResult(
+            year,
+            day,
+            part=solution_part_report.part,
+            result=str(solution_part_report.result),
+            time_taken=solution_part_report.time_taken,
+        )
+        for solution_part_report in [solution_report.part1, solution_report.part2]
+        if solution_part_report
+    ]
+
+
+def _load_cache() -> dict:
+    if not VERIFY_CACHE_FILE.exists():
+        return {}
+
+    # an unreadable cache is only a lost speed-up, days are run again
+    try:
+        return json.loads(VERIFY_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict) -> None:
+    VERIFY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    VERIFY_CACHE_FILE.write_text(json.dumps(cache, indent=4))
+
+
+def verify(
+    year: Optional[int] = None,
+    sample: bool = False,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> list[VerificationResult]:
+    """Run every implemented day in parallel and compare with the recorded answers.
+
+    Results of a day are reused from the cache as long as its input and the source
+    files of utils/ and of its year of solutions/ are unchanged.
+    """
+    cache = _load_cache() if use_cache else {}
+    fingerprints = {}
+    results = []
+    to_run = []
+
+    for solution_year, day in discover_solutions(year):
+        key = f"{solution_year}/{day:02d}{'/sample' if sample else ''}"
+        fingerprint = _fingerprint(solution_year, day, sample)
+        fingerprints[key] = fingerprint
+        if not fingerprint:
+            results.append(
+                VerificationResult(
+                    solution_year, day, status=VerificationStatus.MISSING_INPUT
+                )
+            )
+            continue
+
+        cached = cache.get(key)
+        if cached and cached["fingerprint"] == fingerprint:
+            results.extend(
+                VerificationResult(**result, cached=True)
+                for result in cached["results"]
+            )
+        else:
+            to_run.append((key, solution_year, day))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            key: executor.submit(_run_day, solution_year, day, sample)
+            for key, solution_year, day in to_run
+        }
+        for key, future in futures.items():
+            day_results = future.result()
+            results.extend(day_results)
+
+            # only cache days that ran to completion
+            if all(result.error is None for result in day_results):
+                cache[key] = {
+                    "fingerprint": fingerprints[key],
+                    "results": [
+                        {
+                            "year": result.year,
+                            "day": result.day,
+                            "part": result.part,
+                            "result": result.result,
+                            "time_taken": result.time_taken,
+                        }
+                        for result in day_results
+                    ],
+                }
+
+    if use_cache:
+        _save_cache(cache)
+
+    answer_store = AnswerStore()
+    for result in results:
+        if result.status is not None:
+            continue
+
+        result.expected = answer_store.get(result.year, result.day, result.part, sample)
+        if result.expected is None:
+            result.status = VerificationStatus.UNKNOWN
+        elif result.result == result.expected:
+            result.status = VerificationStatus.PASSED
+        else:
+            result.status = VerificationStatus.FAILED
+
+    return sorted(
+        results, key=lambda result: (result.year, result.day, result.part or 0)
+    )